@@ -10,6 +10,7 @@ from docx import Document
 import os, re
 from datetime import datetime
 from collections import defaultdict
+from sqlalchemy import update
 
 load_dotenv()
 
@@ -49,6 +50,10 @@ ALLOWED_REFERRERS = {'library', 'read'}
 
 ALLOWED_EXTENSIONS = {'txt', 'docx'}
 
+REVIEW_BATCH_SIZE = 20
+
+REVIEW_GRADES = {'again': 1, 'hard': 3, 'good': 4, 'easy': 5}
+
 # --- Admin Decorator ---
 def admin_required(f):
     @wraps(f)
@@ -296,6 +301,50 @@ def remove_word(word):
     db.session.commit()
     return redirect(url_for('library'))
 
+@app.route('/review/<language>', methods=['GET', 'POST'])
+@login_required
+def review(language):
+    if request.method == 'POST':
+        grades = {}
+        for key, value in request.form.items():
+            if key.startswith('grade-') and value in REVIEW_GRADES:
+                try:
+                    grades[int(key[len('grade-'):])] = REVIEW_GRADES[value]
+                except ValueError:
+                    continue
+
+        if grades:
+            now = datetime.utcnow()
+            cards = KnownWord.query.filter(
+                KnownWord.user_id == current_user.id,
+                KnownWord.language == language,
+                KnownWord.id.in_(grades)
+            ).all()
+            if cards:
+                # One executemany UPDATE keyed on primary key for the whole batch
+                db.session.execute(update(KnownWord), [card.next_review(grades[card.id], now) for card in cards])
+                db.session.commit()
+            flash(f"Reviewed {len(cards)} {language} word(s).")
+
+        return redirect(url_for('review', language=language))
+
+    cards = KnownWord.due(current_user.id, language, REVIEW_BATCH_SIZE)
+    words = [card.word for card in cards]
+    meanings = Meaning.query.filter(
+        Meaning.user_id == current_user.id,
+        Meaning.language == language,
+        Meaning.word.in_(words)
+    ).all() if words else []
+    word_meanings = {m.word: m.meaning for m in meanings}
+
+    return render_template(
+        'review.html',
+        language=language,
+        cards=cards,
+        word_meanings=word_meanings,
+        grades=REVIEW_GRADES
+    )
+
 @app.route('/profile')
 @login_required
 def profile():
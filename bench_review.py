@@ -0,0 +1,66 @@
+# bench_review.py
+# Times review-queue fetches and batched grading against users with growing vocabularies.
+# Runs against an in-memory SQLite database: python bench_review.py
+import random, statistics, time
+from datetime import datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import insert, text, update
+
+from models import db, User, KnownWord
+
+SIZES = [1_000, 10_000, 100_000]
+FETCH_LIMIT = 20
+RUNS = 200
+LANGUAGE = 'Spanish'
+
+app = Flask(__name__)
+app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+db.init_app(app)
+
+def seed(user_id, size, now):
+    rows = [{
+        'word': f'w{user_id}_{i}',
+        'language': LANGUAGE if i % 2 else 'French',
+        'user_id': user_id,
+        'due_at': now + timedelta(days=random.randint(-30, 30)),
+    } for i in range(size)]
+    db.session.execute(insert(KnownWord), rows)
+    db.session.commit()
+
+def median_ms(fn):
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+with app.app_context():
+    db.create_all()
+    now = datetime.utcnow()
+    random.seed(0)
+
+    for user_id, size in enumerate(SIZES, start=1):
+        db.session.add(User(id=user_id, username=f'user{user_id}', email=f'user{user_id}@example.com', password_hash='x'))
+        seed(user_id, size, now)
+
+    sql = str(KnownWord.query
+              .filter(KnownWord.user_id == 1, KnownWord.language == LANGUAGE, KnownWord.due_at <= now)
+              .order_by(KnownWord.due_at)
+              .limit(FETCH_LIMIT)
+              .statement.compile(compile_kwargs={'literal_binds': True}))
+    for row in db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}')):
+        print(f'plan: {row[-1]}')
+    print()
+
+    print(f"{'words':>10} {'fetch (ms)':>12} {'grade (ms)':>12}")
+    for user_id, size in enumerate(SIZES, start=1):
+        fetch = median_ms(lambda: KnownWord.due(user_id, LANGUAGE, FETCH_LIMIT, now))
+
+        def grade():
+            cards = KnownWord.due(user_id, LANGUAGE, FETCH_LIMIT, now)
+            db.session.execute(update(KnownWord), [card.next_review(random.choice([1, 3, 4, 5]), now) for card in cards])
+            db.session.rollback()
+
+        print(f'{size:>10} {fetch:>12.3f} {median_ms(grade):>12.3f}')
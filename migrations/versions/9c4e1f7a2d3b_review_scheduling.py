@@ -0,0 +1,41 @@
+"""Review scheduling
+
+Revision ID: 9c4e1f7a2d3b
+Revises: 2b2957699309
+Create Date: 2026-10-18 10:12:05.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e1f7a2d3b'
+down_revision = '2b2957699309'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing known words start with fresh scheduling state and are due immediately
+    with op.batch_alter_table('known_word', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('interval_days', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('ease', sa.Float(), nullable=False, server_default='2.5'))
+        batch_op.add_column(sa.Column('repetitions', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('due_at', sa.DateTime(), nullable=False, server_default=sa.func.now()))
+        batch_op.create_index('ix_known_word_user_language_due', ['user_id', 'language', 'due_at'], unique=False)
+
+    with op.batch_alter_table('meaning', schema=None) as batch_op:
+        batch_op.create_index('ix_meaning_user_language_word', ['user_id', 'language', 'word'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('meaning', schema=None) as batch_op:
+        batch_op.drop_index('ix_meaning_user_language_word')
+
+    with op.batch_alter_table('known_word', schema=None) as batch_op:
+        batch_op.drop_index('ix_known_word_user_language_due')
+        batch_op.drop_column('due_at')
+        batch_op.drop_column('repetitions')
+        batch_op.drop_column('ease')
+        batch_op.drop_column('interval_days')
@@ -1,7 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime
+from datetime import datetime, timedelta
 import uuid
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -31,16 +31,60 @@ class Meaning(db.Model):
     language = db.Column(db.String(50), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
 
+    __table_args__ = (
+        db.Index('ix_meaning_user_language_word', 'user_id', 'language', 'word'),
+    )
+
 class KnownWord(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     word = db.Column(db.String(100), nullable=False)
     language = db.Column(db.String(50), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
 
+    # Spaced-repetition (SM-2) scheduling state
+    interval_days = db.Column(db.Integer, nullable=False, default=0)
+    ease = db.Column(db.Float, nullable=False, default=2.5)
+    repetitions = db.Column(db.Integer, nullable=False, default=0)
+    due_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
     __table_args__ = (
         db.UniqueConstraint('user_id', 'word', 'language', name='unique_known_word_per_language'),
+        db.Index('ix_known_word_user_language_due', 'user_id', 'language', 'due_at'),
     )
 
+    @classmethod
+    def due(cls, user_id, language, limit, now=None):
+        # Range scan on ix_known_word_user_language_due, stops after `limit` rows
+        now = now or datetime.utcnow()
+        return (cls.query
+                .filter(cls.user_id == user_id, cls.language == language, cls.due_at <= now)
+                .order_by(cls.due_at)
+                .limit(limit)
+                .all())
+
+    def next_review(self, grade, now=None):
+        """Return the SM-2 scheduling state after answering with `grade` (0-5)."""
+        now = now or datetime.utcnow()
+        if grade < 3:
+            repetitions = 0
+            interval_days = 1
+        else:
+            repetitions = self.repetitions + 1
+            if repetitions == 1:
+                interval_days = 1
+            elif repetitions == 2:
+                interval_days = 6
+            else:
+                interval_days = round(self.interval_days * self.ease)
+        ease = max(1.3, self.ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+        return {
+            'id': self.id,
+            'interval_days': interval_days,
+            'ease': ease,
+            'repetitions': repetitions,
+            'due_at': now + timedelta(days=interval_days),
+        }
+
 class File(db.Model):
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = db.Column(db.String(255))